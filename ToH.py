@@ -1,5 +1,51 @@
+from collections import deque
 from enum import Enum
+from functools import lru_cache
 import os
+import shutil
+import sys
+
+# Optional JIT support for quiet auto-solves of large puzzles
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+# ANSI color codes
+RESET = "\033[0m"
+CYAN = "\033[96m"
+YELLOW = "\033[93m"
+GREEN = "\033[92m"
+MAGENTA = "\033[95m"
+RED = "\033[91m"
+BOLD = "\033[1m"
+
+# ANSI escape that clears the terminal and homes the cursor
+CLEAR = "\x1b[2J\x1b[H"
+# Largest supported number of disks; towers store widths in a bytearray
+MAX_DISKS = 255
+
+# Set to False (e.g. with --no-clear) to never clear the screen between frames
+clear_enabled = True
+
+def enable_vt_mode():
+    """
+    Enables ANSI escape processing on Windows 10+ consoles.
+    Does nothing on other platforms.
+    """
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        pass
 
 # Enum for representing tower positions
 class Position(Enum):
@@ -7,68 +53,49 @@ class Position(Enum):
     CENTER = 2
     RIGHT = 3
 
-# Disk class with comparison support for sorting by width
-class Disk:
-    def __init__(self, width):
-        self.width = width
-
-    def __lt__(self, other):
-        return self.width < other.width
-
-    def __str__(self):
-        return f"Disk({self.width})"
-
-# Basic LinkedStack implementation for tower storage
+# Basic stack implementation for tower storage, backed by a bytearray.
+# Items must be ints in range(256), which covers any practical disk width.
 class LinkedStack:
-    class Node:
-        def __init__(self, data, next_node=None):
-            self.data = data
-            self.next = next_node
+    __slots__ = ("_data",)
 
     def __init__(self):
-        self.top_node = None
-        self._size = 0
+        self._data = bytearray()
 
     @property
     def size(self):
-        return self._size
+        return len(self._data)
 
     def is_empty(self):
-        return self.top_node is None
+        return not self._data
 
     def peek(self):
-        if self.is_empty():
+        if not self._data:
             raise IndexError("Peek from empty stack")
-        return self.top_node.data
+        return self._data[-1]
 
     def pop(self):
-        if self.is_empty():
+        if not self._data:
             raise IndexError("Pop from empty stack")
-        data = self.top_node.data
-        self.top_node = self.top_node.next
-        self._size -= 1
-        return data
+        return self._data.pop()
 
     def push(self, data):
-        self.top_node = self.Node(data, self.top_node)
-        self._size += 1
+        self._data.append(data)
 
     def __len__(self):
-        return self._size
+        return len(self._data)
 
     def __str__(self):
-        elems = []
-        current = self.top_node
-        while current:
-            elems.append(str(current.data))
-            current = current.next
-        return "[" + ", ".join(elems) + "]"
-
-# Tower class inheriting LinkedStack with rules for disk placement
+        return "[" + ", ".join(str(d) for d in reversed(self._data)) + "]"
+
+# Tower class inheriting LinkedStack with rules for disk placement.
+# Disks are represented by their integer width.
 class Tower(LinkedStack):
+    __slots__ = ("_position", "_pos_name")
+
     def __init__(self, position):
         super().__init__()
         self._position = position
+        self._pos_name = position.name  # Cached for move messages
 
     @property
     def position(self):
@@ -76,66 +103,267 @@ class Tower(LinkedStack):
 
     # Push method enforcing Tower of Hanoi rule: no larger disk on smaller disk
     def push(self, disk):
-        if disk is None:
-            raise ValueError("Disk cannot be None")
-        if self.is_empty() or self.peek() > disk:
-            super().push(disk)
-        else:
+        d = self._data
+        if d and d[-1] <= disk:
             raise Exception("Cannot place larger disk on smaller disk")
+        d.append(disk)
 
     def __str__(self):
         return f"Tower {self.position.name}: {super().__str__()}"
 
+# Builds the text for one disk (or an empty peg when width is 0).
+# It is only called to fill HanoiSolver._row_cache, where every key is
+# distinct, so the cache exists solely to share strings between solvers.
+@lru_cache(maxsize=4096)
+def draw_disk(width, color, max_disk):
+    if width == 0:
+        return f"{BOLD}{color}{' ' * max_disk}|{' ' * max_disk}{RESET}"
+    else:
+        return f"{BOLD}{color}{' ' * (max_disk - width)}" + \
+               "=" * width + "|" + "=" * width + \
+               " " * (max_disk - width) + RESET
+
+# Iterative solver on plain arrays, compiled with Numba when it is available.
+# stacks is a 3 x n array of disk widths (bottom first) and tops holds the
+# number of disks on each pole; both are updated in place.
+def _solve_iter(n, stacks, tops):
+    # The move formula targets pole 2 for odd n and pole 1 for even n
+    perm = (0, 1, 2) if n % 2 == 1 else (0, 2, 1)
+    moves = 0
+    for k in range(1, 1 << n):
+        src = perm[(k & (k - 1)) % 3]
+        dst = perm[((k | (k - 1)) + 1) % 3]
+        tops[src] -= 1
+        stacks[dst, tops[dst]] = stacks[src, tops[src]]
+        tops[dst] += 1
+        moves += 1
+    return moves
+
+if njit is not None:
+    _solve_iter = njit(cache=True)(_solve_iter)
+
+# Number of moves in an optimal solution for num_disks disks. Unlike
+# HanoiSolver this needs no towers, so any number of disks is allowed.
+def num_moves(num_disks):
+    return (1 << num_disks) - 1
+
+def optimal_cost(num_disks, weights):
+    """
+    Returns the minimum total cost of moving num_disks disks from the left to
+    the right tower when moving a disk from pole i to pole j costs weights[i][j]
+    (poles indexed 0, 1, 2 for L, C, R).
+    Uses the recurrence where the largest disk either moves directly
+    (C[n-1][i][k] + w[i][j] + C[n-1][k][j]) or through the third pole
+    (C[n-1][i][j] + w[i][k] + C[n-1][j][i] + w[k][j] + C[n-1][i][j]),
+    filled in bottom-up so only O(n) levels are evaluated.
+    """
+    cost = [[0] * 3 for _ in range(3)]  # Costs for zero disks
+    for _ in range(num_disks):
+        prev = cost
+        cost = [[0] * 3 for _ in range(3)]
+        for i in range(3):
+            for j in range(3):
+                if i == j:
+                    continue
+                k = 3 - i - j
+                direct = prev[i][k] + weights[i][j] + prev[k][j]
+                via = prev[i][j] + weights[i][k] + prev[j][i] + weights[k][j] + prev[i][j]
+                cost[i][j] = min(direct, via)
+    return cost[0][2]
+
 # Main solver class for the Tower of Hanoi puzzle
 class HanoiSolver:
-    def __init__(self, num_disks):
+    # render_every controls how often move redraws the towers: every Nth move,
+    # or never when 0.
+    def __init__(self, num_disks, render_every=1):
+        if num_disks > MAX_DISKS:
+            raise ValueError(f"Number of disks must be at most {MAX_DISKS}")
         self.num_disks = num_disks
         self.left = Tower(Position.LEFT)
         self.center = Tower(Position.CENTER)
         self.right = Tower(Position.RIGHT)
         self.steps = 0  # Add step counter
+        self._right_count = 0  # Disks on the right tower, kept up to date by move
+        self._buf = []  # Pending output lines, written once per frame
+        self._quiet = False  # Skip all output while auto-solving
+        self._render_every = render_every
+        # Prebuilt move messages keyed by (disk, source name, destination name).
+        # Same-tower pairs are included because play() accepts them as moves.
+        self._move_msg = {}
+        names = [pos.name for pos in Position]
+        for width in range(1, num_disks + 1):
+            for src in names:
+                for dst in names:
+                    self._move_msg[(width, src, dst)] = f"Move Disk({width}) from {src} to {dst}"
+        # Precomputed disk rows per color, indexed by width (0 is an empty peg)
+        self._row_cache = {color: [draw_disk(width, color, num_disks) for width in range(num_disks + 1)]
+                           for color in (CYAN, YELLOW, GREEN)}
+        # Static lines drawn above and below the towers
+        col = num_disks * 2 + 2
+        self._header = [
+            f"{MAGENTA}{BOLD}\n╔════════════════════════════════════════════════════════════╗",
+            "║                  TOWER OF HANOI QUEST!                     ║",
+            "╚════════════════════════════════════════════════════════════╝\n" + RESET,
+            " ".join((f"   {CYAN}L".ljust(col), f"{YELLOW}C".ljust(col), f"{GREEN}R".ljust(col) + RESET)),
+        ]
+        self._footer = f"{MAGENTA}{'-' * (col * 3)}{RESET}"
+        # Screen layout of a frame drawn after a clear, used to repaint only
+        # the cells a move changes. Disk level i sits on row _base_row - i.
+        self._base_row = len("\n".join(self._header).split("\n")) + num_disks
+        self._col_for_pos = {Position.LEFT: (1, self._row_cache[CYAN]),
+                             Position.CENTER: (col + 1, self._row_cache[YELLOW]),
+                             Position.RIGHT: (2 * col + 1, self._row_cache[GREEN])}
+        # Widest frame line: the 62-column banner or the footer under the towers
+        self._frame_width = max(62, col * 3)
+        self._frame_on_screen = False  # True while a full frame sits at the top of the screen
 
         # Initialize all disks on the left tower, largest at bottom
         for width in range(num_disks, 0, -1):
-            self.left.push(Disk(width))
+            self.left.push(width)
+        self._map_towers()
+
+    # Builds the lookup tables from positions and input letters to towers
+    def _map_towers(self):
+        self._tower_by_pos = {Position.LEFT: self.left, Position.CENTER: self.center, Position.RIGHT: self.right}
+        self._tower_by_char = {"L": self.left, "C": self.center, "R": self.right}
 
     def get_tower(self, pos):
-        if pos == Position.LEFT:
-            return self.left
-        elif pos == Position.CENTER:
-            return self.center
-        elif pos == Position.RIGHT:
-            return self.right
-        else:
-            raise ValueError("Invalid tower position")
+        try:
+            return self._tower_by_pos[pos]
+        except KeyError:
+            raise ValueError("Invalid tower position") from None
 
     # Moves a disk from one tower to another and prints the action
     def move(self, source, destination, clear_screen=True):
-        if source.is_empty():
-            raise Exception("Source tower is empty.")
-        disk = source.peek()
-        if not destination.is_empty() and destination.peek().width < disk.width:
-            raise Exception("Cannot place larger disk on smaller disk")
+        # Tower.push enforces the placement rule; undo the pop if it refuses
         disk = source.pop()
-        destination.push(disk)
+        try:
+            destination.push(disk)
+        except Exception:
+            source._data.append(disk)
+            raise
         self.steps += 1  # Increment step counter
-        print(f"Step {self.steps}: Move {disk} from {source.position.name} to {destination.position.name}")
-        self.print_towers(clear_screen=clear_screen)
-
-    # Recursive method to solve the Tower of Hanoi problem
+        if destination is self.right:
+            self._right_count += 1
+        if source is self.right:
+            self._right_count -= 1
+        if clear_screen and self._frame_on_screen and not self._quiet:
+            self._draw_move(source, destination, disk)
+        elif not self._quiet and self._render_every and self.steps % self._render_every == 0:
+            self._buf.append(f"Step {self.steps}: {self._move_msg[(disk, source._pos_name, destination._pos_name)]}")
+            self.print_towers(clear_screen=clear_screen)
+
+    # Repaints only the two cells changed by a move on the frame already on
+    # screen, then clears everything below the frame for the next prompt
+    def _draw_move(self, source, destination, disk):
+        base = self._base_row
+        src_col, src_rows = self._col_for_pos[source._position]
+        dst_col, dst_rows = self._col_for_pos[destination._position]
+        sys.stdout.write(f"\x1b[{base - len(source)};{src_col}H{src_rows[0]}"
+                         f"\x1b[{base - len(destination) + 1};{dst_col}H{dst_rows[disk]}"
+                         f"\x1b[{base + 2};1H\x1b[J")
+
+    # Recursive algorithm for the Tower of Hanoi problem, run on an explicit
+    # stack of (n, start, temp, end) work items instead of Python call frames.
+    # A single-disk item is a plain move, so it doubles as the move marker.
     def solve_towers(self, n, start_pole, temp_pole, end_pole):
-        if n == 1:
-            self.move(start_pole, end_pole, clear_screen=False)
+        # Bound methods are kept in locals to avoid attribute lookups in the loop
+        move = self.move
+        work = deque([(n, start_pole, temp_pole, end_pole)])
+        push = work.append
+        pop = work.pop
+        while work:
+            n, start_pole, temp_pole, end_pole = pop()
+            if n < 1:
+                continue  # Nothing to move
+            if n == 1:
+                move(start_pole, end_pole, clear_screen=False)
+                continue
+            # Pushed in reverse so they run in recursive order
+            push((n - 1, temp_pole, start_pole, end_pole))
+            push((1, start_pole, temp_pole, end_pole))
+            push((n - 1, start_pole, end_pole, temp_pole))
+
+    # Iterative method to solve the Tower of Hanoi problem without recursion
+    def solve_towers_iterative(self):
+        """
+        Solves the puzzle with the classic iterative rule.
+        Move k goes from pole (k & (k - 1)) % 3 to pole ((k | (k - 1)) + 1) % 3,
+        which carries the stack from pole 0 to pole 2 for an odd number of
+        disks and to pole 1 for an even number, so the order of the center and
+        right towers is swapped for even counts.
+        """
+        if self.num_disks % 2 == 1:
+            poles = (self.left, self.center, self.right)
+        else:
+            poles = (self.left, self.right, self.center)
+        total = 1 << self.num_disks
+        if self._quiet:
+            # Nothing to draw and every move is legal, so skip move() and
+            # shift the disks directly, settling the counters at the end
+            self._check_start()
+            pops = [pole._data.pop for pole in poles]
+            appends = [pole._data.append for pole in poles]
+            for k in range(1, total):
+                appends[((k | (k - 1)) + 1) % 3](pops[(k & (k - 1)) % 3]())
+            self.steps += total - 1
+            self._right_count = len(self.right)
             return
-        self.solve_towers(n - 1, start_pole, end_pole, temp_pole)
-        self.move(start_pole, end_pole, clear_screen=False)
-        self.solve_towers(n - 1, temp_pole, start_pole, end_pole)
-
-    # Starts the solving process and prints the initial state
-    def solve(self):
+        move = self.move
+        for k in range(1, total):
+            move(poles[(k & (k - 1)) % 3], poles[((k | (k - 1)) + 1) % 3], clear_screen=False)
+
+    # Number of moves in an optimal solution, without simulating it
+    def num_moves(self):
+        return num_moves(self.num_disks)
+
+    # Minimum cost of solving this puzzle with weighted moves; see optimal_cost()
+    def optimal_cost(self, weights):
+        return optimal_cost(self.num_disks, weights)
+
+    # The unchecked solvers assume the starting position; refuse anything else
+    def _check_start(self):
+        if len(self.left) != self.num_disks or self.center or self.right:
+            raise ValueError("Solver must start with all disks on the left tower")
+
+    # Runs the compiled iterative solver and copies the result back to the towers
+    def _solve_jit(self):
+        self._check_start()
+        towers = (self.left, self.center, self.right)
+        stacks = np.zeros((3, self.num_disks), dtype=np.int64)
+        tops = np.zeros(3, dtype=np.int64)
+        for i, tower in enumerate(towers):
+            tops[i] = len(tower._data)
+            stacks[i, :tops[i]] = list(tower._data)
+        self.steps += _solve_iter(self.num_disks, stacks, tops)
+        # Cheap sanity check on the compiled result before trusting it
+        if list(tops) != [0, 0, self.num_disks]:
+            raise RuntimeError("Compiled solver did not finish on the right tower")
+        for i, tower in enumerate(towers):
+            tower._data = bytearray(stacks[i, :tops[i]].tolist())
+        self._right_count = len(self.right)
+
+    # Starts the solving process and prints the initial state.
+    # With quiet=True no output is produced, which is useful for large puzzles;
+    # the iterative quiet solve uses the Numba-compiled loop when available.
+    def solve(self, recursive=False, quiet=False):
         self.steps = 0  # Reset step counter for auto-solve
-        self.print_towers(clear_screen=False)
-        self.solve_towers(self.num_disks, self.left, self.center, self.right)
+        if quiet and not recursive and njit is not None:
+            self._solve_jit()
+            return
+        self._quiet = quiet
+        if not quiet and self._render_every:
+            self.print_towers(clear_screen=False)
+        try:
+            if recursive:
+                self.solve_towers(self.num_disks, self.left, self.center, self.right)
+            else:
+                self.solve_towers_iterative()
+        finally:
+            self._quiet = False
+        # Always show the final state, even if the last move was not drawn
+        if not quiet and self._render_every and self.steps % self._render_every:
+            self.print_towers(clear_screen=False)
 
     # Interactive game loop for Tower of Hanoi
     def play(self):
@@ -153,7 +381,7 @@ class HanoiSolver:
             self.print_towers()
             steps = 0  # Step counter
             # Main game loop: continue until all disks are on the right tower
-            while not self.right.size == self.num_disks:
+            while self._right_count != self.num_disks:
                 try:
                     # Get user input for source and destination towers
                     src = input("Enter source tower (L/C/R or Q to quit): ").strip().upper()
@@ -164,24 +392,27 @@ class HanoiSolver:
                     if dst == "Q":
                         print(f"You gave up after {steps} moves. Better luck next time!")
                         break
-                    src_tower = self._parse_tower(src)
-                    dst_tower = self._parse_tower(dst)
-                    # Check if source tower is empty
-                    if src_tower.is_empty():
-                        print("Source tower is empty. Try again.")
-                        continue
                     try:
+                        src_tower = self._parse_tower(src)
+                        dst_tower = self._parse_tower(dst)
+                        # Check if source tower is empty
+                        if src_tower.is_empty():
+                            print("Source tower is empty. Try again.")
+                            # Messages may scroll the frame, so redraw it fully next time
+                            self._frame_on_screen = False
+                            continue
                         # Attempt to move disk and print towers
                         self.move(src_tower, dst_tower)
                         steps += 1  # Increment step counter
                     except Exception as e:
                         print(f"Invalid move: {e}")
+                        self._frame_on_screen = False
                 except (KeyboardInterrupt, EOFError):
                     # Handle user exit
                     print(f"\nGame exited after {steps} moves.")
                     break
             # Congratulate user if puzzle is solved
-            if self.right.size == self.num_disks:
+            if self._right_count == self.num_disks:
                 print(f"Congratulations! You solved the puzzle in {steps} moves.")
             # Ask if user wants to retry
             retry = input("Do you want to play again? (Y/N): ").strip().upper()
@@ -193,92 +424,89 @@ class HanoiSolver:
             self.center = Tower(Position.CENTER)
             self.right = Tower(Position.RIGHT)
             for width in range(self.num_disks, 0, -1):
-                self.left.push(Disk(width))
+                self.left.push(width)
+            self._right_count = 0
+            self._map_towers()
 
     def _parse_tower(self, s):
         """
         Helper method to convert user input (L/C/R) to the corresponding tower object.
         Raises ValueError for invalid input.
         """
-        if s == "L":
-            return self.left
-        elif s == "C":
-            return self.center
-        elif s == "R":
-            return self.right
-        else:
-            raise ValueError("Invalid tower selection. Use L, C, or R.")
+        try:
+            return self._tower_by_char[s]
+        except KeyError:
+            raise ValueError("Invalid tower selection. Use L, C, or R.") from None
 
     # Prints the current state of all towers with terminal GUI
     def print_towers(self, clear_screen=True):
-        # ANSI color codes
-        RESET = "\033[0m"
-        CYAN = "\033[96m"
-        YELLOW = "\033[93m"
-        GREEN = "\033[92m"
-        MAGENTA = "\033[95m"
-        RED = "\033[91m"
-        BOLD = "\033[1m"
-
-        def get_disks(tower):
-            disks = []
-            current = tower.top_node
-            while current:
-                disks.append(current.data.width)
-                current = current.next
-            return disks[::-1] 
-
-        left_disks = get_disks(self.left)
-        center_disks = get_disks(self.center)
-        right_disks = get_disks(self.right)
+        left_disks = self.left._data
+        center_disks = self.center._data
+        right_disks = self.right._data
         max_height = max(len(left_disks), len(center_disks), len(right_disks), self.num_disks)
-        max_disk = self.num_disks
-
-        # Helper to draw a disk or empty space
-        def draw_disk(width, color):
-            if width == 0:
-                return f"{BOLD}{color}{' ' * max_disk}|{' ' * max_disk}{RESET}"
-            else:
-                return f"{BOLD}{color}{' ' * (max_disk - width)}" + \
-                       "=" * width + "|" + "=" * width + \
-                       " " * (max_disk - width) + RESET
-
-        if clear_screen:
-            os.system('cls' if os.name == 'nt' else 'clear')
-        print(f"{MAGENTA}{BOLD}\n╔════════════════════════════════════════════════════════════╗")
-        print("║                  TOWER OF HANOI QUEST!                     ║")
-        print("╚════════════════════════════════════════════════════════════╝\n" + RESET)
-        print(f"   {CYAN}L".ljust(max_disk*2+2), f"{YELLOW}C".ljust(max_disk*2+2), f"{GREEN}R".ljust(max_disk*2+2) + RESET)
+        left_rows = self._row_cache[CYAN]
+        center_rows = self._row_cache[YELLOW]
+        right_rows = self._row_cache[GREEN]
+
+        # Build the whole frame first and write it with a single call
+        out = self._buf
+        prefix = ""
+        if clear_screen and clear_enabled:
+            out.clear()  # Anything pending would be wiped by the clear anyway
+            prefix = CLEAR
+        # Partial repaints need the frame to fit without wrapping, plus both
+        # prompt lines and the row the last Enter moves to, without scrolling
+        size = shutil.get_terminal_size()
+        self._frame_on_screen = (bool(prefix) and self._base_row + 4 <= size.lines
+                                 and self._frame_width <= size.columns)
+        out.extend(self._header)
         # Print from bottom to top so largest disks are at the bottom
         for i in range(max_height-1, -1, -1):
             l = left_disks[i] if i < len(left_disks) else 0
             c = center_disks[i] if i < len(center_disks) else 0
             r = right_disks[i] if i < len(right_disks) else 0
-            print(draw_disk(l, CYAN), draw_disk(c, YELLOW), draw_disk(r, GREEN))
-        print(f"{MAGENTA}{'-' * ((max_disk*2+2)*3)}{RESET}")
+            out.append(" ".join((left_rows[l], center_rows[c], right_rows[r])))
+        out.append(self._footer)
+        sys.stdout.write(prefix + "\n".join(out) + "\n")
+        out.clear()
 
 # Example usage when running this file directly
 if __name__ == "__main__":
     import time
+    # Let frames accumulate in the stdout buffer instead of flushing per line;
+    # input() still flushes pending output before each prompt.
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    if "--no-clear" in sys.argv[1:] or not sys.stdout.isatty():
+        clear_enabled = False
+    else:
+        enable_vt_mode()
     try:
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if clear_enabled:
+            sys.stdout.write(CLEAR)
         print("\033[95m\033[1m")
         print("╔════════════════════════════════════════════════════════════╗")
         print("║                  WELCOME TO TOWER OF HANOI                 ║")
         print("╚════════════════════════════════════════════════════════════╝")
         print("\033[0m")
+        sys.stdout.flush()  # Show the text above before pausing
         time.sleep(0.5)
         num = int(input("Enter number of disks (default 3): ") or "3")
+        if not 1 <= num <= MAX_DISKS:
+            raise ValueError("Number of disks out of range")
     except ValueError:
         num = 3
-    solver = HanoiSolver(num)
     print("\nChoose your mode:")
     print("  1. Play (interactive)")
     print("  2. Auto-solve (watch the magic!)")
     print("  3. ??? (mystery mode)")  # New mode
     mode = input("Type 'play' for interactive game, 'mystery' for the new mode, anything else for auto-solve: ").strip().lower()
+    # Auto-solve only draws a bounded number of frames for large puzzles
+    render_every = 1 if mode in ("play", "mystery") else 1 << max(num - 8, 0)
+    solver = HanoiSolver(num, render_every=render_every)
     if mode == "play":
         print("\n\033[92mGet ready for your quest!\033[0m")
+        sys.stdout.flush()
         time.sleep(0.5)
         solver.play()
     elif mode == "mystery":
@@ -286,6 +514,7 @@ if __name__ == "__main__":
         # Placeholder: does nothing for now
     else:
         print("\n\033[93mAuto-solving the puzzle...\033[0m")
+        sys.stdout.flush()
         time.sleep(0.5)
         solver.solve()
 